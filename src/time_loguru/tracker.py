@@ -1,15 +1,62 @@
 from __future__ import annotations
 
+import heapq
+import io
+import math
+import os
+import sys
 import time
 import threading
+import weakref
+from collections import defaultdict
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import Awaitable, DefaultDict, Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
 
 try:
     from loguru import logger as _loguru_logger
 except Exception:  # pragma: no cover
     _loguru_logger = None
 
+_perf_ns = time.perf_counter_ns
+
+# Upper bound on remembered validated task names (guards against unbounded dynamic names).
+_TASK_NAME_CACHE_SIZE = 1024
+
+# Levels reachable through the context-manager API.
+_LEVEL_NAMES = ("TRACE", "DEBUG", "INFO", "SUCCESS", "WARNING", "ERROR", "CRITICAL")
+
+
+def _only_tracker_events(record) -> bool:
+    """Loguru filter shared by every event sink; Loguru records always carry "extra"."""
+    return record["extra"].get("event") == "time_logger"
+
+
+# One summary row (leading newline included), parsed once instead of per-row f-strings.
+_ROW_FMT = "\n{0:30}  {1:7d}  {2:>14}  {3:>14}  {4:>14}  {5:>14}  {6:>14}"
+_ROW_FMT_DROPPED = _ROW_FMT + "  {7:9d}"
+
+# Calibration loop length for auto_disable's per-block overhead estimate.
+_CALIBRATION_ROUNDS = 2000
+
+
+# Loguru formats {time} when the file is opened and again on every rotation,
+# so with a midnight rotation each (local) day gets its own file.
+_DAILY_LOG_FILENAME = "time_tracker_{time:YYYYMMDD}.log"
+
+
+def _duration_ns(elapsed_s: float) -> int:
+    if not (elapsed_s >= 0.0 and math.isfinite(elapsed_s)):
+        raise ValueError("durations must be finite and non-negative")
+    return int(round(elapsed_s * 1e9))
+
+
+def _fmt_ms(seconds: float) -> str:
+    return f"{seconds * 1000.0:.3f} ms"
+
+
+def _fmt_s(seconds: float) -> str:
+    return f"{seconds:.6f} s"
+
 
 @dataclass(frozen=True)
 class TaskStats:
@@ -19,25 +66,97 @@ class TaskStats:
     avg_s: float
     min_s: float
     max_s: float
-    last_s: float
+    last_s: float  # most recent sample, across all threads
+    dropped: int = 0  # samples skipped by auto_disable (not part of the other columns)
+
+
+class TaskAccumulator:
+    """
+    Running aggregates for one task, updated in O(1) per recorded sample.
+
+    Durations are integer nanoseconds so long runs accumulate without float drift;
+    they are converted to seconds only when TaskStats are built.
+
+    last_at_ns is the perf_counter_ns() stamp of the LAST sample, so merging shards
+    keeps the most recent sample regardless of thread or registration order.
+
+    ema_ns/dropped are only maintained while auto_disable is on (see configure()).
+    """
+
+    __slots__ = ("count", "total_ns", "min_ns", "max_ns", "last_ns", "last_at_ns", "ema_ns", "dropped")
+
+    def __init__(
+        self,
+        count: int,
+        total_ns: int,
+        min_ns: int,
+        max_ns: int,
+        last_ns: int,
+        last_at_ns: int,
+        dropped: int = 0,
+    ) -> None:
+        self.count = count
+        self.total_ns = total_ns
+        self.min_ns = min_ns
+        self.max_ns = max_ns
+        self.last_ns = last_ns
+        self.last_at_ns = last_at_ns
+        self.ema_ns = last_ns
+        self.dropped = dropped
+
+    def merge(self, other: "TaskAccumulator") -> None:
+        """Fold another accumulator for the same task into this one."""
+        self.count += other.count
+        self.total_ns += other.total_ns
+        if other.min_ns < self.min_ns:
+            self.min_ns = other.min_ns
+        if other.max_ns > self.max_ns:
+            self.max_ns = other.max_ns
+        if other.last_at_ns >= self.last_at_ns:
+            self.last_ns = other.last_ns
+            self.last_at_ns = other.last_at_ns
+            self.ema_ns = other.ema_ns
+        self.dropped += other.dropped
+
+
+class _ShardOwner:
+    """Per-thread sentinel kept in the TLS; its finalizer retires the thread's shard."""
+
+    __slots__ = ("__weakref__",)
+
+
+def _fold(into: Dict[str, TaskAccumulator], shard: Dict[str, TaskAccumulator]) -> None:
+    # dict.copy() is atomic under the GIL, so owners may keep recording.
+    for task, acc in shard.copy().items():
+        if not acc.count:
+            continue
+        m = into.get(task)
+        if m is None:
+            into[task] = TaskAccumulator(
+                acc.count, acc.total_ns, acc.min_ns, acc.max_ns, acc.last_ns, acc.last_at_ns, acc.dropped
+            )
+        else:
+            m.merge(acc)
 
 
 class _TaskContext:
+    __slots__ = ("_tracker", "_task", "_level_name", "_t0")
+
     def __init__(self, tracker: "TimeTracker", task: str, level_name: str) -> None:
         self._tracker = tracker
         self._task = task
         self._level_name = level_name
-        self._t0: Optional[float] = None
+        self._t0: Optional[int] = None
 
     def __enter__(self) -> "_TaskContext":
-        self._t0 = time.perf_counter()
+        self._t0 = _perf_ns()
         return self
 
     def __exit__(self, exc_type, exc, tb) -> bool:
-        t1 = time.perf_counter()
-        t0 = self._t0 if self._t0 is not None else t1
-        elapsed = max(0.0, t1 - t0)
-        self._tracker._record(self._task, elapsed, level_name=self._level_name, exc_type=exc_type)
+        t1 = _perf_ns()
+        t0 = self._t0
+        elapsed_ns = t1 - t0 if t0 is not None else 0  # perf_counter_ns is monotonic
+        self._tracker._record(self._task, elapsed_ns, t1, self._level_name, exc_type)
         return False  # never swallow exceptions
 
 
@@ -51,6 +170,10 @@ class TimeTracker:
         with tracker.warning("TASK"): ...
         ... etc.
 
+    Timings measured elsewhere can be ingested in bulk:
+        tracker.record_many("TASK", [0.12, 0.09, ...])
+        tracker.record_batch([("LOAD", 0.12), ("TRAIN", 1.5), ...])
+
     Notes:
     - Tracker owns: timing + aggregation + summary computation
     - Loguru owns: sinks/handlers, formatting, rotation, retention, filtering, serialization
@@ -63,12 +186,33 @@ class TimeTracker:
             logger = _loguru_logger
 
         self._logger = logger
+        # Bound once: per-event fields are passed as log() kwargs, which Loguru
+        # captures into record["extra"] alongside these constant tags.
+        self._event_logger = logger.bind(event="time_logger", kind="event")
+        self._event_log = self._event_logger.log  # prebound for the per-event path
         self._lock = threading.Lock()
-        self._records: Dict[str, List[float]] = {}
+        # Per-thread accumulator shards: recording touches only the calling
+        # thread's shard (no lock). The registry is copy-on-write: writers rebuild
+        # the tuple under the lock, readers just load it.
+        # When a thread exits, its shard is queued on _dead_shards (list.append is
+        # atomic, so the finalizer never takes the lock) and later folded into
+        # _retired under the lock, keeping the registry sized to live threads.
+        self._tls = threading.local()
+        self._all_shards: Tuple[Dict[str, TaskAccumulator], ...] = ()
+        self._dead_shards: List[Dict[str, TaskAccumulator]] = []
+        self._retired: Dict[str, TaskAccumulator] = {}
+
+        # raw task name -> validated, stripped and interned name, to skip re-validation
+        # in hot loops; interning lets shard lookups short-circuit on identity
+        self._task_names: Dict[str, str] = {}
 
         # tracker-owned knobs
         self._emit_each: bool = False
+        self._event_level_no: Optional[int] = None  # minimum severity for per-block events
+        self._emit_levels: FrozenSet[str] = frozenset()  # levels that emit, derived by configure()
+        self._min_tracked_ns: Optional[int] = None  # auto_disable threshold; None = record everything
         self._time_unit: str = "s"  # "ms" or "s"
+        self._fmt_time = _fmt_s  # formatter specialized for _time_unit by configure()
         self._summary_level: str = "INFO"
 
         # Optional bookkeeping: sink ids created by add_event_sink()
@@ -99,9 +243,47 @@ class TimeTracker:
         return self._ctx(task, "CRITICAL")
 
     def _ctx(self, task: str, level_name: str) -> _TaskContext:
-        if not isinstance(task, str) or not task.strip():
-            raise ValueError("task name must be a non-empty string")
-        return _TaskContext(self, task.strip(), level_name)
+        return _TaskContext(self, self._task_name(task), level_name)
+
+    def _task_name(self, task: str) -> str:
+        name = self._task_names.get(task) if type(task) is str else None
+        if name is None:
+            if not isinstance(task, str) or not task.strip():
+                raise ValueError("task name must be a non-empty string")
+            name = sys.intern(task.strip())
+            if len(self._task_names) >= _TASK_NAME_CACHE_SIZE:
+                self._task_names.clear()
+            self._task_names[task] = name
+        return name
+
+    # -----------------------------
+    # Batch ingestion of externally measured timings
+    # -----------------------------
+    def record_many(self, task: str, elapsed_s: Iterable[float]) -> None:
+        """
+        Record many durations (seconds) for one task with a single accumulator update.
+
+        Samples are aggregated only; no per-sample events are emitted. Every duration
+        is checked first, so an invalid one raises ValueError and records nothing.
+        The last element becomes the task's LAST sample, stamped at call time.
+        """
+        name = self._task_name(task)
+        samples = [_duration_ns(e) for e in elapsed_s]
+        if samples:
+            self._accumulate(name, samples)
+
+    def record_batch(self, pairs: Iterable[Tuple[str, float]]) -> None:
+        """
+        Record (task, duration_s) pairs, grouped per task before merging.
+
+        Samples are aggregated only; no per-sample events are emitted. Every pair is
+        checked first, so an invalid task or duration raises ValueError and records nothing.
+        """
+        grouped: DefaultDict[str, List[int]] = defaultdict(list)
+        for task, e in pairs:
+            grouped[self._task_name(task)].append(_duration_ns(e))
+        for name, samples in grouped.items():
+            self._accumulate(name, samples)
 
     # -----------------------------
     # Optional: access underlying logger
@@ -117,6 +299,8 @@ class TimeTracker:
         emit_each: Optional[bool] = None,
         time_unit: Optional[str] = None,
         summary_level: Optional[str] = None,
+        event_level: Optional[str] = None,
+        auto_disable: Optional[bool] = None,
     ) -> "TimeTracker":
         """
         Configure tracker-owned behavior.
@@ -127,38 +311,122 @@ class TimeTracker:
             "ms" or "s"
         summary_level:
             Loguru level used by summary().
+        event_level:
+            Minimum Loguru level for per-block events (e.g. "INFO" drops
+            trace/debug blocks before any formatting). Blocks are still aggregated.
+            Pass "TRACE" to lift the threshold again (every level emits).
+        auto_disable:
+            If True, stop recording samples of a task whose recent average duration
+            (EMA) falls below 2x the tracker's own per-block overhead, measured once
+            here. Skipped samples are neither aggregated nor emitted; summary() shows
+            them in a DROPPED column whenever any task has dropped samples. The first sample of a task is always recorded.
         """
+        min_no = None
+        if event_level is not None:
+            min_no = self._logger.level(str(event_level)).no
+        min_tracked_ns = None
+        if auto_disable:
+            min_tracked_ns = 2 * self._calibrate_overhead_ns()
+
         with self._lock:
             if emit_each is not None:
                 self._emit_each = bool(emit_each)
+            if min_no is not None:
+                # TRACE is the lowest level reachable via the context managers: no gate
+                self._event_level_no = None if min_no <= self._logger.level("TRACE").no else min_no
+            if auto_disable is not None:
+                self._min_tracked_ns = min_tracked_ns
             if time_unit is not None:
                 if time_unit not in ("ms", "s"):
                     raise ValueError('time_unit must be "ms" or "s"')
                 self._time_unit = time_unit
+                self._fmt_time = _fmt_ms if time_unit == "ms" else _fmt_s
             if summary_level is not None:
                 self._summary_level = str(summary_level)
+            self._emit_levels = self._resolve_emit_levels()
         return self
 
-    def add_event_sink(self, file_path: str, **add_kwargs) -> int:
+    def _calibrate_overhead_ns(self) -> int:
+        # Time empty blocks on a scratch tracker (emission off) so our own stats stay clean.
+        probe = TimeTracker(logger=self._logger)
+
+        def one_round() -> int:
+            t0 = _perf_ns()
+            for _ in range(_CALIBRATION_ROUNDS):
+                with probe.info("calibrate"):
+                    pass
+            return (_perf_ns() - t0) // _CALIBRATION_ROUNDS
+
+        best = one_round()
+        for _ in range(2):
+            best = min(best, one_round())
+        return best
+
+    def _resolve_emit_levels(self) -> FrozenSet[str]:
+        # Decided once here so _record gates events with a single set lookup.
+        if not self._emit_each:
+            return frozenset()
+        if self._event_level_no is None:
+            return frozenset(_LEVEL_NAMES)
+        return frozenset(name for name in _LEVEL_NAMES if self._logger.level(name).no >= self._event_level_no)
+
+    def add_event_sink(self, file_path, **add_kwargs) -> int:
         """
         Optional convenience: add a Loguru sink that receives ONLY tracker events.
 
         Delegates to loguru.logger.add(file_path, filter=..., **add_kwargs)
 
+        If file_path is an existing directory, events go to
+        <file_path>/time_tracker_YYYYMMDD.log, rotated at local midnight
+        (rotation="00:00" unless given) so a long-running process starts a new
+        file each day.
+
+        Writes happen synchronously by default. enqueue=True can be passed to hand
+        records to Loguru's worker (e.g. for multiprocess use), but it pickles each
+        record onto a pipe and so costs the caller more per event than a buffered write.
+
+        The file is block-buffered (buffering=65536) instead of Loguru's line-buffered
+        default, so many events share one write(2). Buffered lines reach the file when
+        the buffer fills or the sink is removed (Loguru removes sinks at exit).
+        Pass buffering=1 to restore per-line flushing. Only applies to file paths;
+        streams and callables are passed to Loguru without it.
+
+        Any other Loguru sink is passed through unchanged, including coroutine
+        functions: Loguru schedules those as tasks on the running event loop. That only
+        keeps the loop unblocked if the coroutine itself does non-blocking I/O; a plain
+        open().write() inside it still blocks. Use `await tracker.complete()` to drain them.
+
         Example:
             tracker.add_event_sink("timing_only.log", rotation="10 MB", retention="7 days")
         """
-        def _only_tracker_events(record) -> bool:
-            return record.get("extra", {}).get("event") == "time_logger"
+        is_path = isinstance(file_path, (str, os.PathLike))
+        if is_path and os.path.isdir(file_path):
+            file_path = os.path.join(file_path, _DAILY_LOG_FILENAME)
+            add_kwargs.setdefault("rotation", "00:00")
 
+        if is_path:
+            add_kwargs.setdefault("buffering", 1 << 16)
         sink_id = self._logger.add(file_path, filter=_only_tracker_events, **add_kwargs)
         with self._lock:
             self._event_sink_ids.append(sink_id)
         return sink_id
 
+    def complete(self) -> Awaitable[None]:
+        """
+        Wait until queued tracker events have been handled by their sinks.
+
+        Delegates to loguru.logger.complete(): call it directly from sync code, or
+        `await tracker.complete()` inside a coroutine to also await async sinks.
+        """
+        return self._logger.complete()
+
     def clear(self) -> None:
         with self._lock:
-            self._records.clear()
+            self._reap_dead_shards()
+            self._retired.clear()
+            shards = self._all_shards
+        for shard in shards:
+            shard.clear()
 
     # -----------------------------
     # Summary
@@ -177,7 +445,7 @@ class TimeTracker:
 
         The table is emitted as raw text so its formatting is preserved.
         """
-        stats = self._compute_stats()
+        merged = self._merge_shards()
 
         key_funcs = {
             "total": lambda s: s.total_s,
@@ -190,11 +458,19 @@ class TimeTracker:
         if sort_by not in key_funcs:
             raise ValueError(f"sort_by must be one of: {', '.join(key_funcs.keys())}")
 
-        stats.sort(key=key_funcs[sort_by], reverse=descending)
-        if limit is not None:
-            stats = stats[: max(0, int(limit))]
+        key = key_funcs[sort_by]
+        if limit is not None and int(limit) < len(merged):
+            # O(N log k) selection that only materializes k TaskStats;
+            # same result as sort + slice (ties keep input order)
+            select = heapq.nlargest if descending else heapq.nsmallest
+            stats = select(max(0, int(limit)), self._iter_stats(merged), key=key)
+        else:
+            stats = sorted(self._iter_stats(merged), key=key, reverse=descending)
 
-        rendered = self._render_summary(stats, title=title)
+        # Decided over all tasks (not just the selected rows) so under-reported
+        # COUNT/TOTAL stay visible even after auto_disable is switched off.
+        show_dropped = any(acc.dropped for acc in merged.values())
+        rendered = self._render_summary(stats, title=title, show_dropped=show_dropped)
 
         # Tag it as a tracker summary event
         self._logger.bind(event="time_logger", kind="summary").opt(raw=True).log(
@@ -209,81 +485,145 @@ class TimeTracker:
     # -----------------------------
     # Internal: record + format
     # -----------------------------
-    def _record(self, task: str, elapsed_s: float, *, level_name: str, exc_type=None) -> None:
-        with self._lock:
-            self._records.setdefault(task, []).append(elapsed_s)
-
-        if self._emit_each:
+    def _record(self, task: str, elapsed_ns: int, at_ns: int, level_name: str, exc_type=None) -> None:
+        # Hot path: called positionally from _TaskContext.__exit__ for every tracked block.
+        shard = getattr(self._tls, "records", None)
+        if shard is None:
+            shard = self._local_shard()
+
+        try:
+            acc = shard[task]
+        except KeyError:
+            shard[task] = TaskAccumulator(1, elapsed_ns, elapsed_ns, elapsed_ns, elapsed_ns, at_ns)
+        else:
+            min_tracked_ns = self._min_tracked_ns
+            if min_tracked_ns is not None:
+                acc.ema_ns += (elapsed_ns - acc.ema_ns) >> 3  # EMA, alpha = 1/8
+                if acc.ema_ns < min_tracked_ns:
+                    acc.dropped += 1
+                    return
+            acc.count += 1
+            acc.total_ns += elapsed_ns
+            acc.last_ns = elapsed_ns
+            acc.last_at_ns = at_ns
+            if elapsed_ns < acc.min_ns:
+                acc.min_ns = elapsed_ns
+            if elapsed_ns > acc.max_ns:
+                acc.max_ns = elapsed_ns
+
+        if level_name in self._emit_levels:
+            elapsed_s = elapsed_ns / 1e9
             status = "OK" if exc_type is None else f"EXC:{getattr(exc_type, '__name__', str(exc_type))}"
-            bound = self._logger.bind(
-                event="time_logger",
-                kind="event",
-                task=task,
-                elapsed_s=elapsed_s,
-                status=status,
-            )
-            bound.log(
+            self._event_log(
                 level_name,
                 "task={task} | elapsed={elapsed}",
                 # "task={task} status={status} elapsed={elapsed}",
                 task=task,
+                elapsed_s=elapsed_s,
                 status=status,
                 elapsed=self._fmt_time(elapsed_s),
             )
 
-    def _fmt_time(self, seconds: float) -> str:
-        if self._time_unit == "ms":
-            return f"{seconds * 1000.0:.3f} ms"
-        return f"{seconds:.6f} s"
-
-    def _compute_stats(self) -> List[TaskStats]:
+    def _accumulate(self, task: str, samples_ns: List[int]) -> None:
+        batch = TaskAccumulator(
+            len(samples_ns), sum(samples_ns), min(samples_ns), max(samples_ns), samples_ns[-1], _perf_ns()
+        )
+        shard = self._local_shard()
+        acc = shard.get(task)
+        if acc is None:
+            shard[task] = batch
+        else:
+            acc.merge(batch)
+
+    def _local_shard(self) -> Dict[str, TaskAccumulator]:
+        shard = getattr(self._tls, "records", None)
+        if shard is None:
+            shard = {}
+            owner = _ShardOwner()
+            weakref.finalize(owner, self._dead_shards.append, shard)
+            self._tls.records = shard
+            self._tls.owner = owner
+            self._shards_register(shard)
+        return shard
+
+    def _shards_register(self, shard: Dict[str, TaskAccumulator]) -> None:
         with self._lock:
-            items = list(self._records.items())
-
-        out: List[TaskStats] = []
-        for task, d in items:
-            if not d:
-                continue
-            total = float(sum(d))
-            count = len(d)
-            out.append(
-                TaskStats(
-                    task=task,
-                    count=count,
-                    total_s=total,
-                    avg_s=total / count,
-                    min_s=float(min(d)),
-                    max_s=float(max(d)),
-                    last_s=float(d[-1]),
-                )
+            self._reap_dead_shards()
+            self._all_shards = self._all_shards + (shard,)
+
+    def _reap_dead_shards(self) -> None:
+        # Caller holds self._lock.
+        if not self._dead_shards:
+            return
+        dead = {}
+        while self._dead_shards:
+            shard = self._dead_shards.pop()
+            dead[id(shard)] = shard
+        self._all_shards = tuple(s for s in self._all_shards if id(s) not in dead)
+        for shard in dead.values():
+            _fold(self._retired, shard)
+
+    def _merge_shards(self) -> Dict[str, TaskAccumulator]:
+        merged: Dict[str, TaskAccumulator] = {}
+        with self._lock:
+            self._reap_dead_shards()
+            _fold(merged, self._retired)
+            shards = self._all_shards
+        for shard in shards:
+            _fold(merged, shard)
+        return merged
+
+    @staticmethod
+    def _iter_stats(merged: Dict[str, TaskAccumulator]) -> Iterator[TaskStats]:
+        for task, acc in merged.items():
+            yield TaskStats(
+                task=task,
+                count=acc.count,
+                total_s=acc.total_ns / 1e9,
+                avg_s=acc.total_ns / acc.count / 1e9,
+                min_s=acc.min_ns / 1e9,
+                max_s=acc.max_ns / 1e9,
+                last_s=acc.last_ns / 1e9,
+                dropped=acc.dropped,
             )
-        return out
 
-    def _render_summary(self, stats: List[TaskStats], *, title: str) -> str:
-        lines: List[str] = []
-        lines.append(title)
-        lines.append("-" * max(24, len(title)))
-
-        if not stats:
-            lines.append("(no data)")
-            return "\n".join(lines)
+    def _render_summary(self, stats: Iterable[TaskStats], *, title: str, show_dropped: bool = False) -> str:
+        buf = io.StringIO()
+        buf.write(title)
+        buf.write("\n" + "-" * max(24, len(title)))
 
         header = f"{'TASK':30}  {'COUNT':>7}  {'TOTAL':>14}  {'AVG':>14}  {'MIN':>14}  {'MAX':>14}  {'LAST':>14}"
-        lines.append(header)
-        lines.append("-" * len(header))
+        if show_dropped:
+            header += f"  {'DROPPED':>9}"
+        rule = "-" * len(header)
+        grand_total = 0.0
+        empty = True
+        write = buf.write
+        format_row = (_ROW_FMT_DROPPED if show_dropped else _ROW_FMT).format
+        fmt = self._fmt_time
 
         for s in stats:
-            lines.append(
-                f"{s.task[:30]:30}  "
-                f"{s.count:7d}  "
-                f"{self._fmt_time(s.total_s):>14}  "
-                f"{self._fmt_time(s.avg_s):>14}  "
-                f"{self._fmt_time(s.min_s):>14}  "
-                f"{self._fmt_time(s.max_s):>14}  "
-                f"{self._fmt_time(s.last_s):>14}"
+            if empty:
+                buf.write(f"\n{header}\n{rule}")
+                empty = False
+            grand_total += s.total_s
+            write(
+                format_row(
+                    s.task[:30],
+                    s.count,
+                    fmt(s.total_s),
+                    fmt(s.avg_s),
+                    fmt(s.min_s),
+                    fmt(s.max_s),
+                    fmt(s.last_s),
+                    s.dropped,
+                )
             )
 
-        grand_total = sum(s.total_s for s in stats)
-        lines.append("-" * len(header))
-        lines.append(f"{'TOTAL (all tasks)':30}  {'':7}  {self._fmt_time(grand_total):>14}")
-        return "\n".join(lines)
+        if empty:
+            buf.write("\n(no data)")
+            return buf.getvalue()
+
+        buf.write(f"\n{rule}")
+        buf.write(f"\n{'TOTAL (all tasks)':30}  {'':7}  {self._fmt_time(grand_total):>14}")
+        return buf.getvalue()